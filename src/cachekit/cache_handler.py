@@ -363,7 +363,7 @@ def _get_cached_serializer_instance(
 
     # String name - use cached lookup with integrity_checking setting
     serializer_name = serializer
-    cache_key = f"{serializer_name}:{enable_integrity_checking}"
+    cache_key = (serializer_name, enable_integrity_checking)
 
     # Fast path: check if already cached (lock-free read)
     if cache_key in _serializer_instance_cache:
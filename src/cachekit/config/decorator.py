@@ -136,7 +136,7 @@ def _resolve_backend(explicit_backend: object = _UNSET) -> BaseBackend | None:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DecoratorConfig:
     """Unified immutable configuration for cache decorator.
 
@@ -13,7 +13,7 @@ from dataclasses import dataclass, field
 from .validation import ConfigurationError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class L1CacheConfig:
     """L1 (in-memory) cache configuration.
 
@@ -71,7 +71,7 @@ class L1CacheConfig:
             raise ConfigurationError(f"L1 swr_threshold_ratio must be in (0.0, 1.0], got {self.swr_threshold_ratio}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CircuitBreakerConfig:
     """Circuit breaker configuration for graceful degradation.
 
@@ -131,7 +131,7 @@ class CircuitBreakerConfig:
             raise ConfigurationError(f"half_open_requests must be >= 1, got {self.half_open_requests}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BackpressureConfig:
     """Backpressure configuration for overload protection.
 
@@ -181,7 +181,7 @@ class BackpressureConfig:
             raise ConfigurationError(f"max_concurrent_requests must be >= 1, got {self.max_concurrent_requests}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MonitoringConfig:
     """Observability and monitoring configuration.
 
@@ -225,7 +225,7 @@ class MonitoringConfig:
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EncryptionConfig:
     """Encryption configuration for PII/sensitive data.
 
@@ -182,7 +182,8 @@ class CircuitBreaker:
     When Redis is experiencing issues, the circuit breaker will "open" and
     start failing fast, giving the system time to recover.
 
-    Thread-safe implementation using RLock to handle concurrent requests.
+    Thread-safe implementation using RLock to handle concurrent requests; the
+    CLOSED-state admission check and success record take no lock at all.
     Integrates with Prometheus metrics for monitoring circuit state.
 
     Example usage:
@@ -230,7 +231,13 @@ class CircuitBreaker:
         3. HALF_OPEN: Check if test permits available
 
         Thread-safe: Uses double-checked locking to ensure atomic state transitions.
+        The CLOSED check runs before the lock: reading ``_state`` is a single atomic
+        attribute load, and a request that races a CLOSED -> OPEN transition is
+        indistinguishable from one that arrived just before it.
         """
+        if self._state is CircuitState.CLOSED:
+            return True  # Lock-free fast path for normal operation
+
         with self._lock:
             current_time = time.time()
 
@@ -290,6 +297,10 @@ class CircuitBreaker:
 
     def _on_success(self):
         """Handle successful operation."""
+        # Successes only move the state machine in HALF_OPEN; skip the lock otherwise
+        if self._state is not CircuitState.HALF_OPEN:
+            return
+
         with self._lock:
             if self._state == CircuitState.HALF_OPEN:
                 # Decrement permits as request completes
@@ -7,7 +7,9 @@ backpressure, and other reliability features.
 import logging
 import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
 from typing import Any, ClassVar, Optional
 
 logger = logging.getLogger(__name__)
@@ -136,20 +138,24 @@ class AsyncMetricsCollector:
         self._metrics = defaultdict(lambda: defaultdict(float))
         self._lock = threading.RLock()
 
-        # Queue for async processing
-        import queue
+        # Bounded FIFO for async processing. A plain deque guarded by one lock: producers
+        # append under the lock and the worker drains everything queued per acquisition.
+        self._metric_queue: deque[dict] = deque()
+        self._queue_lock = threading.Lock()
+        self._queue_not_empty = threading.Condition(self._queue_lock)
+        self._queue_drained = threading.Condition(self._queue_lock)
+        self._unfinished = 0  # Enqueued but not yet processed (guarded by _queue_lock)
 
-        self._metric_queue = queue.Queue(maxsize=max_queue_size)
+        # Statistics tracking
+        self._stats: dict[str, Any] = {"processed_count": 0, "dropped_count": 0, "queue_size": 0}
+        self._stats_lock = threading.Lock()
+        self._stats_view: Mapping[str, Any] = MappingProxyType(self._stats)
 
         # Worker thread management
         self._shutdown_event = threading.Event()
         self._worker_thread = None
         self._start_worker()
 
-        # Statistics tracking
-        self._stats: dict[str, Any] = {"processed_count": 0, "dropped_count": 0, "queue_size": 0}
-        self._stats_lock = threading.Lock()
-
     def _start_worker(self):
         """Start the background worker thread."""
         if self._worker_thread is None or not self._worker_thread.is_alive():
@@ -159,33 +165,33 @@ class AsyncMetricsCollector:
 
     def _worker_loop(self):
         """Main worker loop for processing metrics."""
-        import queue
-
         while not self._shutdown_event.is_set():
-            try:
-                # Wait for metric with timeout to allow shutdown checks
-                metric_data = self._metric_queue.get(timeout=self.worker_timeout)
+            with self._queue_lock:
+                if not self._metric_queue:
+                    # Wait with timeout to allow shutdown checks
+                    self._queue_not_empty.wait(self.worker_timeout)
+                batch = list(self._metric_queue)
+                self._metric_queue.clear()
+
+            if not batch:
+                continue
 
-                # Process the metric
-                self._process_metric(metric_data)
+            try:
+                for metric_data in batch:
+                    self._process_metric(metric_data)
 
                 # Update statistics
                 with self._stats_lock:
-                    self._stats["processed_count"] += 1
-                    self._stats["queue_size"] = self._metric_queue.qsize()
-
-                self._metric_queue.task_done()
-
-            except queue.Empty:
-                # Timeout - continue to check shutdown
-                continue
+                    self._stats["processed_count"] += len(batch)
+                    self._stats["queue_size"] = len(self._metric_queue)
             except Exception as e:
                 # Log error but keep worker running
                 logger.error(f"Error processing metric in worker thread: {e}")
-                try:
-                    self._metric_queue.task_done()
-                except ValueError:
-                    pass  # task_done() called more times than get()
+            finally:
+                with self._queue_lock:
+                    self._unfinished -= len(batch)
+                    if not self._unfinished:
+                        self._queue_drained.notify_all()
 
     def _process_metric(self, metric_data: dict):
         """Process a single metric."""
@@ -235,16 +241,20 @@ class AsyncMetricsCollector:
 
     def _enqueue_metric(self, metric_data: dict):
         """Add metric to processing queue."""
-        import queue
+        with self._queue_lock:
+            full = 0 < self.max_queue_size <= len(self._metric_queue)
+            if not full:
+                self._metric_queue.append(metric_data)
+                self._unfinished += 1
+                self._queue_not_empty.notify()
+            queue_size = len(self._metric_queue)
 
-        try:
-            self._metric_queue.put_nowait(metric_data)
-            with self._stats_lock:
-                self._stats["queue_size"] = self._metric_queue.qsize()
-        except queue.Full:
-            # Queue is full - drop the metric
-            with self._stats_lock:
+        with self._stats_lock:
+            self._stats["queue_size"] = queue_size
+            if full:
+                # Queue is full - drop the metric
                 self._stats["dropped_count"] += 1
+        if full:
             logger.warning(f"Metrics queue full, dropped metric: {metric_data.get('name', 'unknown')}")
 
     def record_counter(self, name: str, labels: Optional[dict[str, str]] = None, value: float = 1.0):
@@ -262,6 +272,36 @@ class AsyncMetricsCollector:
         metric_data = {"type": "gauge", "name": name, "value": value, "labels": labels or {}}
         self._enqueue_metric(metric_data)
 
+    def record_batch(self, metrics: Iterable[tuple[str, str, float, Optional[dict[str, str]]]]):
+        """Record several metrics with a single queue lock acquisition.
+
+        Args:
+            metrics: (metric_type, name, value, labels) tuples, where metric_type is
+                "counter", "histogram" or "gauge".
+
+        Metrics that do not fit in the queue are dropped and counted, as with the
+        single-metric record_* methods.
+        """
+        enqueued = 0
+        dropped = 0
+        with self._queue_lock:
+            for metric_type, name, value, labels in metrics:
+                if 0 < self.max_queue_size <= len(self._metric_queue):
+                    dropped += 1
+                    continue
+                self._metric_queue.append({"type": metric_type, "name": name, "value": value, "labels": labels or {}})
+                enqueued += 1
+            if enqueued:
+                self._unfinished += enqueued
+                self._queue_not_empty.notify()
+            queue_size = len(self._metric_queue)
+
+        with self._stats_lock:
+            self._stats["queue_size"] = queue_size
+            self._stats["dropped_count"] += dropped
+        if dropped:
+            logger.warning(f"Metrics queue full, dropped {dropped} batched metric(s)")
+
     def record_operation(self, operation: str, duration: float, labels: Optional[dict[str, str]] = None):
         """Record an operation with duration."""
         self.record_histogram(f"{operation}_duration", duration, labels)
@@ -270,7 +310,7 @@ class AsyncMetricsCollector:
         """Get all recorded statistics."""
         with self._stats_lock:
             stats = dict(self._stats)
-            stats["queue_size"] = self._metric_queue.qsize()
+            stats["queue_size"] = len(self._metric_queue)
 
         # Add local metrics
         with self._lock:
@@ -278,6 +318,16 @@ class AsyncMetricsCollector:
 
         return stats
 
+    @property
+    def stats_view(self) -> Mapping[str, Any]:
+        """Live read-only view of processed_count, dropped_count and queue_size.
+
+        Unlike get_stats(), no dict is built per read and the values track the
+        collector as it runs, which suits polling. Use get_stats() for a
+        consistent snapshot that also includes local metrics.
+        """
+        return self._stats_view
+
     def clear(self):
         """Clear all metrics."""
         with self._lock:
@@ -288,20 +338,29 @@ class AsyncMetricsCollector:
             self._stats["dropped_count"] = 0
 
     def flush(self, timeout: float = 2.0):
-        """Flush all pending metrics with timeout."""
+        """Flush all pending metrics with timeout.
+
+        Blocks until the worker has processed every queued metric, so
+        processed_count is up to date on return.
+        """
         if self._worker_thread and self._worker_thread.is_alive():
-            # Wait for queue to be processed
-            start_time = time.time()
-            while not self._metric_queue.empty() and (time.time() - start_time) < timeout:
-                time.sleep(0.01)
+            deadline = time.monotonic() + timeout
+            with self._queue_lock:
+                while self._unfinished:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._queue_drained.wait(remaining)
 
     def shutdown(self, timeout: float = 2.0):
         """Shutdown the collector gracefully."""
         if self._shutdown_event.is_set():
             return  # Already shutdown
 
-        # Signal shutdown
+        # Signal shutdown and wake the worker if it is waiting for metrics
         self._shutdown_event.set()
+        with self._queue_lock:
+            self._queue_not_empty.notify_all()
 
         # Wait for worker to finish
         if self._worker_thread and self._worker_thread.is_alive():
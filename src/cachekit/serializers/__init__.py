@@ -14,6 +14,7 @@ from .base import (
     SerializationMetadata,
     SerializerProtocol,
     SuspiciousCacheEntryError,
+    UnsupportedDataError,
 )
 from .encryption_wrapper import (
     DecryptionAuthenticationError,
@@ -65,8 +66,8 @@ retrieved, _ = test_storage.retrieve(envelope)
 assert retrieved == test_data, "ByteStorage validation failed"
 
 # Serializer factory with double-checked locking
-# Cache key format: "name:integrity_checking" to support different configurations
-_serializer_cache: dict[str, Any] = {}
+# Cache key is the (name, integrity_checking) tuple - hashed without building a string per call
+_serializer_cache: dict[tuple[str, bool], Any] = {}
 _serializer_lock = Lock()
 
 # Registry maps serializer names to factory functions (not classes directly)
@@ -81,6 +82,15 @@ SERIALIZER_REGISTRY = {
     "encrypted": EncryptionWrapper,  # StandardSerializer + AES-256-GCM encryption
 }
 
+# Rejection of unknown names is a single set probe; the message is rendered once at import
+_VALID_SERIALIZERS = frozenset(SERIALIZER_REGISTRY)
+_UNKNOWN_SERIALIZER_MSG = (
+    "Unknown serializer: {!r}. "
+    f"Valid options: {', '.join(SERIALIZER_REGISTRY)}. "
+    "To use a custom serializer, pass instance directly: "
+    "@cache(serializer=MySerializer())"
+)
+
 
 def get_serializer(name: str, enable_integrity_checking: bool = True) -> SerializerProtocol:
     """Get cached serializer instance by name with configurable integrity checking (thread-safe).
@@ -114,28 +124,22 @@ def get_serializer(name: str, enable_integrity_checking: bool = True) -> Seriali
         ValueError: Unknown serializer: 'invalid'. Valid options: default, std, auto, arrow, orjson
     """
     # Cache key includes integrity_checking setting to support both configurations
-    cache_key = f"{name}:{enable_integrity_checking}"
+    cache_key = (name, enable_integrity_checking)
 
     # Fast path: Check cache without lock (read-only, thread-safe)
     if cache_key in _serializer_cache:
         return _serializer_cache[cache_key]
 
-    # Slow path: Validate and instantiate with lock
+    # Validate name before taking the lock - unknown names are never cached
+    if name not in _VALID_SERIALIZERS:
+        raise ValueError(_UNKNOWN_SERIALIZER_MSG.format(name))
+
+    # Slow path: Instantiate with lock
     with _serializer_lock:
         # Double-check: Another thread may have created it
         if cache_key in _serializer_cache:
             return _serializer_cache[cache_key]
 
-        # Validate name
-        if name not in SERIALIZER_REGISTRY:
-            valid_names = ", ".join(SERIALIZER_REGISTRY.keys())
-            raise ValueError(
-                f"Unknown serializer: '{name}'. "
-                f"Valid options: {valid_names}. "
-                f"To use a custom serializer, pass instance directly: "
-                f"@cache(serializer=MySerializer())"
-            )
-
         # Get serializer class (lazy-load optional serializers if needed)
         if name == "arrow":
             serializer_class = _get_arrow_serializer()
@@ -183,6 +187,13 @@ def benchmark_serializers() -> dict[str, Any]:
     return serializers
 
 
+# (class name, module) reported for lazy-loaded serializers whose dependency is missing
+_OPTIONAL_SERIALIZER_ORIGINS = {
+    "arrow": ("ArrowSerializer", "cachekit.serializers.arrow_serializer"),
+    "orjson": ("OrjsonSerializer", "cachekit.serializers.orjson_serializer"),
+}
+
+
 def get_serializer_info() -> dict[str, dict[str, Any]]:
     """Get information about available serializers."""
     info = {}
@@ -200,11 +211,7 @@ def get_serializer_info() -> dict[str, dict[str, Any]]:
                 info[name].update(instance.get_info())  # type: ignore[attr-defined]
         except ImportError as e:
             # Optional serializer whose backing dependency (pyarrow / orjson) is absent.
-            optional_modules = {
-                "arrow": ("ArrowSerializer", "cachekit.serializers.arrow_serializer"),
-                "orjson": ("OrjsonSerializer", "cachekit.serializers.orjson_serializer"),
-            }
-            cls, module = optional_modules.get(name, ("Unknown", "unknown"))
+            cls, module = _OPTIONAL_SERIALIZER_ORIGINS.get(name, ("Unknown", "unknown"))
             info[name] = {
                 "class": cls,
                 "module": module,
@@ -247,6 +254,7 @@ __all__ = [
     "SerializationMetadata",
     "SerializerProtocol",
     "SuspiciousCacheEntryError",
+    "UnsupportedDataError",
     # Factory
     "get_serializer",
     "SERIALIZER_REGISTRY",
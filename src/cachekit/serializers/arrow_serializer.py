@@ -24,7 +24,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar
 
-from .base import SerializationError, SerializationFormat, SerializationMetadata
+from .base import SerializationError, SerializationFormat, SerializationMetadata, UnsupportedDataError
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -252,7 +252,7 @@ class ArrowSerializer:
         would force even a RangeIndex into a materialized column.
 
         Raises:
-            TypeError: If obj is not a DataFrame (pandas, polars) or dict of arrays
+            UnsupportedDataError: If obj is not a DataFrame (pandas, polars) or dict of arrays
         """
         if HAS_PANDAS and isinstance(obj, pd.DataFrame):
             return pa.Table.from_pandas(obj, preserve_index=None)
@@ -265,13 +265,13 @@ class ArrowSerializer:
             try:
                 return pa.table(obj)
             except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError) as e:
-                raise TypeError(
+                raise UnsupportedDataError(
                     f"ArrowSerializer only supports DataFrames "
                     f"(pandas.DataFrame, polars.DataFrame) or dict of arrays (columnar). "
                     f"Got a dict that is not convertible to an Arrow table: {e}. "
                     f"For scalar values or nested dicts, use AutoSerializer."
                 ) from e
-        raise TypeError(
+        raise UnsupportedDataError(
             f"ArrowSerializer only supports DataFrames "
             f"(pandas.DataFrame, polars.DataFrame) or dict of arrays. "
             f"Got: {type(obj).__name__}. "
@@ -60,7 +60,7 @@ except ImportError:
 
 from cachekit._rust_serializer import ByteStorage
 
-from .base import SerializationError, SerializationFormat, SerializationMetadata
+from .base import SerializationError, SerializationFormat, SerializationMetadata, UnsupportedDataError
 
 logger = logging.getLogger(__name__)
 
@@ -190,7 +190,7 @@ def _auto_default(obj: Any) -> Any:
         MessagePack-compatible representation
 
     Raises:
-        TypeError: For unsupported types with actionable guidance
+        UnsupportedDataError: For unsupported types with actionable guidance
     """
     # Existing: datetime/date/time support (KEEP)
     if isinstance(obj, datetime):
@@ -214,17 +214,17 @@ def _auto_default(obj: Any) -> Any:
 
     # NEW: Helpful error detection for common unsupported types
     if _safe_hasattr(obj, "model_dump"):  # Pydantic BaseModel
-        raise TypeError(PYDANTIC_ERROR_MESSAGE)
+        raise UnsupportedDataError(PYDANTIC_ERROR_MESSAGE)
 
     if _safe_hasattr(obj, "__tablename__"):  # SQLAlchemy/ORM model
-        raise TypeError(ORM_ERROR_MESSAGE)
+        raise UnsupportedDataError(ORM_ERROR_MESSAGE)
 
     if _safe_hasattr(obj, "__dict__") and type(obj).__module__ != "builtins":
         # Custom class (has __dict__ but not a builtin type)
-        raise TypeError(CUSTOM_CLASS_ERROR_MESSAGE)
+        raise UnsupportedDataError(CUSTOM_CLASS_ERROR_MESSAGE)
 
     # Generic MessagePack error (fallback)
-    raise TypeError(f"Object of type {type(obj).__name__} is not MessagePack serializable")
+    raise UnsupportedDataError(f"Object of type {type(obj).__name__} is not MessagePack serializable")
 
 
 def _auto_object_hook(obj: Any) -> Any:
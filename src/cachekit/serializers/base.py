@@ -306,6 +306,23 @@ class SerializationError(Exception):
     pass
 
 
+class UnsupportedDataError(TypeError):
+    """Exception raised when a serializer cannot encode a value's type.
+
+    Subclasses TypeError so existing ``except TypeError`` handlers keep working;
+    callers that only need "this value is not cacheable with this serializer" can
+    catch it by type instead of matching on the message.
+
+    Examples:
+        >>> issubclass(UnsupportedDataError, TypeError)
+        True
+        >>> isinstance(UnsupportedDataError("no"), SerializationError)
+        False
+    """
+
+    pass
+
+
 class SuspiciousCacheEntryError(SerializationError):
     """The unauthenticated envelope of a cache entry is inconsistent with the
     handler's configuration in a way tampering would also produce.
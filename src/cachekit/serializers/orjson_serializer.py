@@ -22,7 +22,7 @@ except ImportError as e:  # pragma: no cover - only reachable without the [json]
 
 import xxhash
 
-from .base import SerializationError, SerializationFormat, SerializationMetadata
+from .base import SerializationError, SerializationFormat, SerializationMetadata, UnsupportedDataError
 
 
 class OrjsonSerializer:
@@ -117,7 +117,7 @@ class OrjsonSerializer:
             Format (integrity OFF): [JSON bytes]
 
         Raises:
-            TypeError: If object type is not JSON-serializable (bytes, custom objects, etc.)
+            UnsupportedDataError: If object type is not JSON-serializable (bytes, custom objects, etc.)
             SerializationError: If serialization fails (data encoding error)
 
         Examples:
@@ -153,7 +153,7 @@ class OrjsonSerializer:
             return envelope, metadata
         except TypeError as e:
             # TypeError = unsupported type (bytes, custom objects, etc.)
-            raise TypeError(
+            raise UnsupportedDataError(
                 f"Object of type {type(obj).__name__} is not JSON-serializable. "
                 f"OrjsonSerializer supports: dict, list, str, int, float, bool, None, datetime, UUID"
             ) from e
@@ -181,7 +181,9 @@ class OrjsonSerializer:
             >>> result == {"test": 123}
             True
         """
-        data = bytes(data)  # coerce unwrap's zero-copy memoryview; no-op when already bytes
+        # Read through a view: checksum and JSON parse both take buffers, so unwrap's
+        # zero-copy payload is never materialized and the checksum split copies nothing
+        data = memoryview(data)
         try:
             if self.enable_integrity_checking:
                 # Guard clause: Minimum size check (8 bytes checksum + at least 2 bytes JSON: {})
@@ -190,7 +192,7 @@ class OrjsonSerializer:
                         f"Invalid data: Expected at least 10 bytes (8-byte checksum + 2-byte JSON), got {len(data)} bytes"
                     )
 
-                # Extract checksum and JSON data
+                # Extract checksum and JSON data (views into the input, not copies)
                 expected_checksum = data[:8]
                 json_data = data[8:]
 
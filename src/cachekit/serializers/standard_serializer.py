@@ -27,7 +27,7 @@ import msgpack
 
 from cachekit._rust_serializer import ByteStorage
 
-from .base import SerializationError, SerializationFormat, SerializationMetadata
+from .base import SerializationError, SerializationFormat, SerializationMetadata, UnsupportedDataError
 
 # Error message constants for unsupported types (Task 2)
 NUMPY_ERROR_MESSAGE = (
@@ -85,7 +85,7 @@ def _standard_default(obj: Any) -> Any:
         MessagePack-compatible representation with __datetime__ marker
 
     Raises:
-        TypeError: For unsupported types with actionable guidance
+        UnsupportedDataError: For unsupported types with actionable guidance
     """
     # Language-universal datetime support (MessagePack extension 0xC0)
     if isinstance(obj, datetime):
@@ -100,29 +100,29 @@ def _standard_default(obj: Any) -> Any:
 
     # NumPy array detection (strict isinstance check)
     if type(obj).__module__ == "numpy" and type(obj).__name__ == "ndarray":
-        raise TypeError(NUMPY_ERROR_MESSAGE)
+        raise UnsupportedDataError(NUMPY_ERROR_MESSAGE)
 
     # Pandas DataFrame/Series detection (strict isinstance check)
     if type(obj).__module__ == "pandas.core.frame" and type(obj).__name__ == "DataFrame":
-        raise TypeError(PANDAS_ERROR_MESSAGE)
+        raise UnsupportedDataError(PANDAS_ERROR_MESSAGE)
     if type(obj).__module__ == "pandas.core.series" and type(obj).__name__ == "Series":
-        raise TypeError(PANDAS_ERROR_MESSAGE)
+        raise UnsupportedDataError(PANDAS_ERROR_MESSAGE)
 
     # Pydantic model detection (check for BaseModel in class hierarchy)
     if "BaseModel" in (base.__name__ for base in type(obj).__mro__):
-        raise TypeError(PYDANTIC_ERROR_MESSAGE)
+        raise UnsupportedDataError(PYDANTIC_ERROR_MESSAGE)
 
     # ORM model detection (check for common ORM base class names)
     orm_base_names = {"Model", "DeclarativeBase", "Base"}
     if any(base.__name__ in orm_base_names for base in type(obj).__mro__):
-        raise TypeError(ORM_ERROR_MESSAGE)
+        raise UnsupportedDataError(ORM_ERROR_MESSAGE)
 
     # Custom class detection (has __dict__ but not a builtin type)
     if hasattr(type(obj), "__dict__") and type(obj).__module__ != "builtins":
-        raise TypeError(CUSTOM_CLASS_ERROR_MESSAGE)
+        raise UnsupportedDataError(CUSTOM_CLASS_ERROR_MESSAGE)
 
     # Generic MessagePack error (fallback)
-    raise TypeError(
+    raise UnsupportedDataError(
         f"Object of type {type(obj).__name__} is not supported by StandardSerializer. "
         f"Supported types: None, bool, int, float, str, bytes, list, tuple, dict, datetime, date, time"
     )
@@ -273,7 +273,7 @@ class StandardSerializer:
             Format (integrity OFF): Pure MessagePack bytes
 
         Raises:
-            TypeError: If object type is not supported (with actionable error message)
+            UnsupportedDataError: If object type is not supported (with actionable error message)
             SerializationError: If serialization fails (data encoding error)
 
         Examples:
@@ -302,7 +302,7 @@ class StandardSerializer:
             )
             return envelope, metadata  # type: ignore[return-value]
         except TypeError:
-            # TypeError = unsupported type (propagate error message from _standard_default)
+            # TypeError = unsupported type (UnsupportedDataError from _standard_default, or msgpack's own)
             raise
         except ValueError as e:
             # ValueError = data encoding error
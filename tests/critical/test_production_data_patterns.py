@@ -35,6 +35,13 @@ import pandas as pd
 # Import from compatibility wrapper
 from tests.critical.cache_serializer_compat import CACHE_SERIALIZER_AVAILABLE, CacheSerializer
 
+# Shared by every "update" audit entry; entries for other actions carry None
+_UPDATE_CHANGES = {
+    "field_changed": "status",
+    "old_value": "inactive",
+    "new_value": "active",
+}
+
 
 class ProductionDataGenerator:
     """Generate realistic enterprise data patterns for testing"""
@@ -275,17 +282,8 @@ class ProductionDataGenerator:
                         "user_agent": "Enterprise-App/1.0",
                         "session_id": f"sess_{i % 100}",
                     },
-                    **(
-                        {
-                            "changes": {
-                                "field_changed": "status",
-                                "old_value": "inactive",
-                                "new_value": "active",
-                            }
-                        }
-                        if actions[i % len(actions)] == "update"
-                        else {}
-                    ),
+                    # Always present so every entry shares one key order
+                    "changes": _UPDATE_CHANGES if actions[i % len(actions)] == "update" else None,
                 }
                 for i in range(entry_count)
             ],
@@ -1,8 +1,5 @@
 """Critical reliability tests using fault injection patterns."""
 
-import time
-from unittest.mock import patch
-
 import pytest
 import redis
 
@@ -13,11 +10,44 @@ from ..utils.redis_test_helpers import RedisIsolationMixin
 
 pytestmark = pytest.mark.critical
 
+# Iterations of simulated work in expensive_operation (a few microseconds of CPU)
+_FAKE_WORK_ITERATIONS = 1000
+
+
+def _fake_work() -> int:
+    """Burn a little CPU without yielding to the OS scheduler like time.sleep()."""
+    return sum(range(_FAKE_WORK_ITERATIONS))
+
+
+def _raise_connection_error(*args, **kwargs):
+    """Stand-in for a Redis command when the server is unreachable."""
+    raise redis.ConnectionError("Redis unavailable")
+
+
+@pytest.fixture
+def intermittent_redis_get(monkeypatch):
+    """Patch redis.Redis.get to alternate between failure and cache miss, failing first.
+
+    Returns the failure/success call counts.
+    """
+    calls = {"failure": 0, "success": 0}
+
+    def intermittent_redis_failure(*args, **kwargs):
+        # Alternate between failure and success
+        if (calls["failure"] + calls["success"]) % 2 == 0:
+            calls["failure"] += 1
+            raise redis.ConnectionError("Intermittent failure")
+        calls["success"] += 1
+        return None  # Cache miss
+
+    monkeypatch.setattr(redis.Redis, "get", intermittent_redis_failure)
+    return calls
+
 
 class TestReliabilityFaultInjection(RedisIsolationMixin):
     """Test reliability under various failure scenarios."""
 
-    def test_redis_connection_failure_graceful_degradation(self):
+    def test_redis_connection_failure_graceful_degradation(self, monkeypatch):
         """Test system behavior when Redis is completely unavailable."""
 
         call_count = 0
@@ -35,16 +65,17 @@ class TestReliabilityFaultInjection(RedisIsolationMixin):
         assert call_count == 1
 
         # Simulate Redis connection failure
-        with patch("redis.Redis.get", side_effect=redis.ConnectionError("Redis unavailable")):
-            with patch("redis.Redis.set", side_effect=redis.ConnectionError("Redis unavailable")):
-                # Operation should still succeed - fallback behavior
-                result2 = cached_operation("test_key2")
+        for attr in ("get", "set"):
+            monkeypatch.setattr(redis.Redis, attr, _raise_connection_error)
 
-                # Should execute function since Redis is unavailable
-                assert result2 == "result_test_key2_2"
-                assert call_count == 2
+        # Operation should still succeed - fallback behavior
+        result2 = cached_operation("test_key2")
 
-    def test_redis_timeout_graceful_handling(self):
+        # Should execute function since Redis is unavailable
+        assert result2 == "result_test_key2_2"
+        assert call_count == 2
+
+    def test_redis_timeout_graceful_handling(self, monkeypatch):
         """Test graceful handling of Redis timeouts."""
 
         timeout_calls = 0
@@ -57,28 +88,26 @@ class TestReliabilityFaultInjection(RedisIsolationMixin):
             return f"timeout_result_{data_id}_{function_calls}"
 
         def slow_redis_get(*args, **kwargs):
+            # Stands in for a slow Redis; only the call count matters, not latency
             nonlocal timeout_calls
             timeout_calls += 1
-            time.sleep(0.1)  # Simulate slow Redis
+            return None
 
         # Simulate slow Redis responses
-        with patch("redis.Redis.get", side_effect=slow_redis_get):
-            start_time = time.time()
-            result = cached_operation_with_timeout("test_key")
-            _elapsed = time.time() - start_time
-
-            # Should return result despite slow Redis
-            assert result == "timeout_result_test_key_1"
-            assert function_calls == 1
-            # With thundering herd protection, we may call Redis.get twice (initial check + double-check in lock)
-            assert timeout_calls >= 1 and timeout_calls <= 2
-            # Test completed (slow Redis doesn't prevent function execution)
-
-    def test_intermittent_redis_failures_resilience(self):
+        monkeypatch.setattr(redis.Redis, "get", slow_redis_get)
+        result = cached_operation_with_timeout("test_key")
+
+        # Should return result despite slow Redis
+        assert result == "timeout_result_test_key_1"
+        assert function_calls == 1
+        # With thundering herd protection, we may call Redis.get twice (initial check + double-check in lock)
+        assert timeout_calls >= 1 and timeout_calls <= 2
+        # Test completed (slow Redis doesn't prevent function execution)
+
+    @pytest.mark.parametrize("i", range(4))
+    def test_intermittent_redis_failures_resilience(self, i, intermittent_redis_get):
         """Test resilience to intermittent Redis failures."""
 
-        failure_count = 0
-        success_count = 0
         function_calls = 0
 
         @cache(ttl=60, namespace="resilience_test")
@@ -87,29 +116,13 @@ class TestReliabilityFaultInjection(RedisIsolationMixin):
             function_calls += 1
             return f"resilient_result_{data_id}_{function_calls}"
 
-        def intermittent_redis_failure(*args, **kwargs):
-            nonlocal failure_count, success_count
-            # Alternate between failure and success
-            if (failure_count + success_count) % 2 == 0:
-                failure_count += 1
-                raise redis.ConnectionError("Intermittent failure")
-            else:
-                success_count += 1
-                return None  # Cache miss
-
-        with patch("redis.Redis.get", side_effect=intermittent_redis_failure):
-            # Run multiple operations to test resilience
-            results = []
-            for i in range(4):
-                result = resilient_operation(f"key_{i}")
-                results.append(result)
-
-            # All operations should succeed despite intermittent Redis failures
-            assert len(results) == 4
-            assert all("resilient_result" in result for result in results)
-            assert function_calls == 4  # All function calls should execute
-            assert failure_count >= 2  # Should have encountered Redis failures
-            assert success_count >= 0  # May have some successes
+        result = resilient_operation(f"key_{i}")
+
+        # Operation should succeed despite intermittent Redis failures; each case decorates afresh
+        assert result == f"resilient_result_key_{i}_1"
+        assert function_calls == 1  # Function call should execute
+        assert intermittent_redis_get["failure"] >= 1  # First Redis get always fails
+        assert intermittent_redis_get["success"] >= 0  # May have some successes
 
     def test_concurrent_cache_stampede_baseline(self):
         """Baseline test showing behavior under concurrent access."""
@@ -120,7 +133,7 @@ class TestReliabilityFaultInjection(RedisIsolationMixin):
         def expensive_operation(data_id: str) -> str:
             nonlocal call_count
             call_count += 1
-            time.sleep(0.01)  # Simulate some work
+            _fake_work()  # Simulate some work
             return f"computed_result_{data_id}_{call_count}"
 
         # Sequential calls should use cache after first call
@@ -179,42 +192,37 @@ class TestBackpressureController:
         assert "healthy" in updated_stats
 
 
+@pytest.fixture(scope="module")
+def cb_default():
+    """One default-config circuit breaker shared by tests that only check it can be built."""
+    try:
+        from cachekit.reliability import CircuitBreaker, CircuitBreakerConfig
+    except ImportError:
+        pytest.skip("CircuitBreaker component not available in current implementation")
+
+    config = CircuitBreakerConfig(failure_threshold=5, timeout_seconds=30.0)
+    return CircuitBreaker(config=config, namespace="test_shared")
+
+
 class TestCircuitBreakerComponent:
     """Test circuit breaker component availability and basic functionality."""
 
-    def test_circuit_breaker_component_exists(self):
+    def test_circuit_breaker_component_exists(self, cb_default):
         """Verify circuit breaker component is available and can be created."""
-        try:
-            from cachekit.reliability import CircuitBreaker, CircuitBreakerConfig
-
-            # Should be able to create circuit breaker
-            config = CircuitBreakerConfig(failure_threshold=5, timeout_seconds=30.0)
-            cb = CircuitBreaker(config=config, namespace="test")
-            assert cb is not None
+        # Should be able to create circuit breaker
+        assert cb_default is not None
 
-        except ImportError:
-            pytest.skip("CircuitBreaker component not available in current implementation")
-
-    def test_circuit_breaker_basic_functionality(self):
+    def test_circuit_breaker_basic_functionality(self, cb_default):
         """Test basic circuit breaker functionality if available."""
-        try:
-            from cachekit.reliability import CircuitBreaker, CircuitBreakerConfig
-
-            config = CircuitBreakerConfig(failure_threshold=3, timeout_seconds=1.0)
-            cb = CircuitBreaker(config=config, namespace="test")
-
-            # Circuit breaker should start in closed state (allowing operations)
-            # Implementation details may vary, but it should be functional
-            assert cb is not None
-
-        except ImportError:
-            pytest.skip("CircuitBreaker component not available in current implementation")
+        # Circuit breaker should start in closed state (allowing operations)
+        # Implementation details may vary, but it should be functional
+        assert cb_default is not None
 
 
 class TestReliabilityIntegration:
     """Integration tests for reliability components with main codebase."""
 
-    def test_cache_decorator_handles_redis_errors_gracefully(self):
+    def test_cache_decorator_handles_redis_errors_gracefully(self, monkeypatch):
         """Test that cache decorator doesn't crash on Redis errors."""
 
         @cache(ttl=60, namespace="integration_test")
@@ -226,27 +234,21 @@ class TestReliabilityIntegration:
         assert result1 == "processed_test_data"
 
         # Should handle Redis errors gracefully
-        with patch("redis.Redis.get", side_effect=redis.ConnectionError("Connection failed")):
-            result2 = reliable_operation("test_data2")
-            assert result2 == "processed_test_data2"
+        monkeypatch.setattr(redis.Redis, "get", _raise_connection_error)
+        result2 = reliable_operation("test_data2")
+        assert result2 == "processed_test_data2"
 
     def test_reliability_components_importable(self):
         """Test that reliability components can be imported without errors."""
 
         # These imports should not raise exceptions
+        from cachekit.reliability import CircuitBreaker, CircuitBreakerConfig
         from cachekit.reliability.load_control import BackpressureController
 
         # Should be able to create instances
         controller = BackpressureController(max_concurrent=10, queue_size=20)
         assert controller is not None
 
-        # Try circuit breaker if available
-        try:
-            from cachekit.reliability import CircuitBreaker, CircuitBreakerConfig
-
-            config = CircuitBreakerConfig(failure_threshold=5, timeout_seconds=30.0)
-            cb = CircuitBreaker(config=config, namespace="test")
-            assert cb is not None
-        except ImportError:
-            # Circuit breaker may not be fully implemented yet
-            pass
+        config = CircuitBreakerConfig(failure_threshold=5, timeout_seconds=30.0)
+        cb = CircuitBreaker(config=config, namespace="test")
+        assert cb is not None
@@ -15,7 +15,6 @@ Coverage targets:
 
 from __future__ import annotations
 
-import time
 from typing import TYPE_CHECKING
 
 import pytest
@@ -32,6 +31,13 @@ from cachekit.reliability.metrics_collection import (
 if TYPE_CHECKING:
     pass
 
+# Classifier inputs are never raised, so one instance per error type is enough
+_TRANSIENT = BackendError("Connection failed", error_type=BackendErrorType.TRANSIENT)
+_TIMEOUT = BackendError("Timeout", error_type=BackendErrorType.TIMEOUT)
+_AUTH = BackendError("Auth failed", error_type=BackendErrorType.AUTHENTICATION)
+_PERM = BackendError("Invalid config", error_type=BackendErrorType.PERMANENT)
+_UNKNOWN = BackendError("Unknown", error_type=BackendErrorType.UNKNOWN)
+
 
 @pytest.mark.critical
 class TestMetricsCollectorSmoke:
@@ -91,60 +97,56 @@ class TestMetricsCollectorSmoke:
 class TestAsyncMetricsCollectorSmoke:
     """Smoke tests for AsyncMetricsCollector."""
 
-    def test_async_collector_instantiates(self):
-        """SMOKE: AsyncMetricsCollector can instantiate."""
+    @pytest.fixture(scope="class")
+    def shared_collector(self):
+        """One collector (and worker thread) for the tests that don't shut it down."""
         collector = AsyncMetricsCollector()
-        assert collector is not None
+        yield collector
         collector.shutdown()
 
-    def test_async_collector_worker_thread_starts(self):
-        """SMOKE: Worker thread starts successfully."""
-        collector = AsyncMetricsCollector()
+    @pytest.fixture
+    def collector(self, shared_collector):
+        """Shared collector, drained and cleared so each test starts from zero."""
+        shared_collector.flush()
+        shared_collector.clear()
+        return shared_collector
 
+    def test_async_collector_instantiates(self, collector):
+        """SMOKE: AsyncMetricsCollector can instantiate."""
+        assert collector is not None
+
+    def test_async_collector_worker_thread_starts(self, collector):
+        """SMOKE: Worker thread starts successfully."""
         # Worker thread should be alive
         assert collector._worker_thread is not None
         assert collector._worker_thread.is_alive()
 
-        collector.shutdown()
-
-    def test_async_collector_records_counter_without_crash(self):
+    def test_async_collector_records_counter_without_crash(self, collector):
         """SMOKE: Recording counter doesn't crash."""
-        collector = AsyncMetricsCollector()
-
         # Should not raise
         collector.record_counter("test_counter", labels={"foo": "bar"})
         collector.record_counter("test_counter", value=5.0)
 
-        # Give worker time to process
-        time.sleep(0.1)
-
-        collector.shutdown()
+        # Wait for the worker to drain the queue
+        collector.flush()
 
-    def test_async_collector_records_gauge_without_crash(self):
+    def test_async_collector_records_gauge_without_crash(self, collector):
         """SMOKE: Recording gauge doesn't crash."""
-        collector = AsyncMetricsCollector()
-
         # Should not raise
         collector.record_gauge("test_gauge", 42.0)
         collector.record_gauge("test_gauge", 100.0, labels={"status": "healthy"})
 
-        # Give worker time to process
-        time.sleep(0.1)
-
-        collector.shutdown()
+        # Wait for the worker to drain the queue
+        collector.flush()
 
-    def test_async_collector_records_histogram_without_crash(self):
+    def test_async_collector_records_histogram_without_crash(self, collector):
         """SMOKE: Recording histogram doesn't crash."""
-        collector = AsyncMetricsCollector()
-
         # Should not raise
         collector.record_histogram("test_histogram", 1.5)
         collector.record_histogram("test_histogram", 2.5, labels={"operation": "get"})
 
-        # Give worker time to process
-        time.sleep(0.1)
-
-        collector.shutdown()
+        # Wait for the worker to drain the queue
+        collector.flush()
 
     def test_async_collector_shutdown_cleans_up(self):
         """SMOKE: Shutdown cleans up worker thread."""
@@ -153,8 +155,8 @@ class TestAsyncMetricsCollectorSmoke:
 
         collector.shutdown()
 
-        # Give thread time to stop
-        time.sleep(0.2)
+        # Shutdown already joins; bound the wait in case the worker is mid-poll
+        collector._worker_thread.join(timeout=1.0)
 
         # Worker thread should stop
         assert not collector._worker_thread.is_alive()
@@ -163,20 +165,16 @@ class TestAsyncMetricsCollectorSmoke:
         """SMOKE: Full queue drops metrics gracefully without crashing."""
         collector = AsyncMetricsCollector(max_queue_size=2)
 
-        # Fill queue + overflow
-        for i in range(10):
-            collector.record_counter("test_counter", value=float(i))
+        # Fill queue + overflow in one submission
+        collector.record_batch([("counter", "test_counter", float(i), None) for i in range(10)])
 
         # Should not crash
-        stats = collector.get_stats()
-        assert "dropped_count" in stats
+        assert "dropped_count" in collector.stats_view
 
         collector.shutdown()
 
-    def test_async_collector_get_stats_without_crash(self):
+    def test_async_collector_get_stats_without_crash(self, collector):
         """SMOKE: Getting stats doesn't crash."""
-        collector = AsyncMetricsCollector()
-
         # Should not raise
         stats = collector.get_stats()
         assert isinstance(stats, dict)
@@ -184,22 +182,18 @@ class TestAsyncMetricsCollectorSmoke:
         assert "dropped_count" in stats
         assert "queue_size" in stats
 
-        collector.shutdown()
-
-    def test_async_collector_clear_without_crash(self):
+    def test_async_collector_clear_without_crash(self, collector):
         """SMOKE: Clearing metrics doesn't crash."""
-        collector = AsyncMetricsCollector()
         collector.record_counter("test_counter", value=10.0)
+        collector.flush()
 
         # Should not raise
         collector.clear()
 
-        stats = collector.get_stats()
+        stats = collector.stats_view
         assert stats["processed_count"] == 0
         assert stats["dropped_count"] == 0
 
-        collector.shutdown()
-
     def test_get_async_metrics_collector_returns_singleton(self):
         """SMOKE: Global collector returns singleton instance."""
         collector1 = get_async_metrics_collector()
@@ -215,39 +209,25 @@ class TestAsyncMetricsCollectorSmoke:
 class TestErrorClassifierSmoke:
     """Smoke tests for BackendErrorClassifier."""
 
-    def test_error_classifier_handles_transient_errors(self):
-        """SMOKE: Classifier handles transient errors without crashing."""
-        # Should not raise
-        transient_error = BackendError("Connection failed", error_type=BackendErrorType.TRANSIENT)
-        timeout_error = BackendError("Timeout", error_type=BackendErrorType.TIMEOUT)
-        assert BackendErrorClassifier.is_circuit_breaker_failure(transient_error) is True
-        assert BackendErrorClassifier.is_circuit_breaker_failure(timeout_error) is True
-
-    def test_error_classifier_handles_permanent_errors(self):
-        """SMOKE: Classifier handles permanent errors without crashing."""
-        # Should not raise
-        auth_error = BackendError("Auth failed", error_type=BackendErrorType.AUTHENTICATION)
-        perm_error = BackendError("Invalid config", error_type=BackendErrorType.PERMANENT)
-        assert BackendErrorClassifier.is_circuit_breaker_failure(auth_error) is False
-        assert BackendErrorClassifier.is_circuit_breaker_failure(perm_error) is False
-
-    def test_error_classifier_handles_unknown_errors(self):
-        """SMOKE: Classifier handles unknown errors without crashing."""
-        # Should not raise
-        unknown_error = BackendError("Unknown", error_type=BackendErrorType.UNKNOWN)
-        assert BackendErrorClassifier.is_circuit_breaker_failure(unknown_error) is True
-        # Non-BackendError exceptions return False
-        assert BackendErrorClassifier.is_circuit_breaker_failure(ValueError()) is False
-        assert BackendErrorClassifier.is_circuit_breaker_failure(RuntimeError()) is False
-
-    def test_error_classifier_get_category_without_crash(self):
-        """SMOKE: Getting error category doesn't crash."""
+    @pytest.mark.parametrize(
+        ("error", "expected_cb_failure", "expected_category"),
+        [
+            (_TRANSIENT, True, "transient"),
+            (_TIMEOUT, True, "timeout"),
+            (_AUTH, False, "authentication"),
+            (_PERM, False, "permanent"),
+            (_UNKNOWN, True, "unknown"),
+            # Non-BackendError exceptions are application errors, never breaker failures
+            (ValueError(), False, "application"),
+            (RuntimeError(), False, "application"),
+        ],
+        ids=["transient", "timeout", "authentication", "permanent", "unknown", "value_error", "runtime_error"],
+    )
+    def test_error_classifier_classifies_without_crash(self, error, expected_cb_failure, expected_category):
+        """SMOKE: Classifier handles every error type without crashing."""
         # Should not raise
-        transient_error = BackendError("Connection failed", error_type=BackendErrorType.TRANSIENT)
-        auth_error = BackendError("Auth failed", error_type=BackendErrorType.AUTHENTICATION)
-        assert BackendErrorClassifier.get_error_category(transient_error) == "transient"
-        assert BackendErrorClassifier.get_error_category(auth_error) == "authentication"
-        assert BackendErrorClassifier.get_error_category(ValueError()) == "application"
+        assert BackendErrorClassifier.is_circuit_breaker_failure(error) is expected_cb_failure
+        assert BackendErrorClassifier.get_error_category(error) == expected_category
 
 
 @pytest.mark.critical
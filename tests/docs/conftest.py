@@ -0,0 +1,42 @@
+"""Shared fixtures for documentation ground-truth tests."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+
+import pytest
+
+from cachekit.config import reset_settings
+from cachekit.serializers import get_available_serializers
+
+# Valid hex-encoded 32-byte key shared by every doc test that needs encryption
+_TEST_MASTER_KEY = "0" * 64
+
+
+@pytest.fixture(scope="session")
+def available_serializers() -> frozenset[str]:
+    """Serializer names from get_available_serializers(), resolved once per session."""
+    return frozenset(get_available_serializers())
+
+
+@pytest.fixture(scope="session")
+def master_key() -> str:
+    """Hex master key for tests exercising documented encryption claims."""
+    return _TEST_MASTER_KEY
+
+
+@pytest.fixture
+def cachekit_env(monkeypatch: pytest.MonkeyPatch) -> Iterator[Callable[..., None]]:
+    """Set environment variables for one test and drop the cached settings singleton.
+
+    monkeypatch restores the environment even when an assertion fails mid-test;
+    the trailing reset_settings() keeps the singleton from outliving these values.
+    """
+
+    def _set(**env: str) -> None:
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        reset_settings()
+
+    yield _set
+    reset_settings()
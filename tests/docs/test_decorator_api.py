@@ -15,30 +15,11 @@ from cachekit import cache
 class TestDecoratorPresetsExist:
     """Verify all documented decorator presets are available."""
 
-    def test_minimal_preset_exists(self):
-        """@cache.minimal preset must exist (documented in README, api-reference)."""
-        assert hasattr(cache, "minimal"), "cache.minimal preset missing"
-        assert callable(cache.minimal), "cache.minimal must be callable"
-
-    def test_production_preset_exists(self):
-        """@cache.production preset must exist (documented in README, api-reference)."""
-        assert hasattr(cache, "production"), "cache.production preset missing"
-        assert callable(cache.production), "cache.production must be callable"
-
-    def test_secure_preset_exists(self):
-        """@cache.secure preset must exist (documented in README, api-reference)."""
-        assert hasattr(cache, "secure"), "cache.secure preset missing"
-        assert callable(cache.secure), "cache.secure must be callable"
-
-    def test_dev_preset_exists(self):
-        """@cache.dev preset must exist (documented in api-reference)."""
-        assert hasattr(cache, "dev"), "cache.dev preset missing"
-        assert callable(cache.dev), "cache.dev must be callable"
-
-    def test_test_preset_exists(self):
-        """@cache.test preset must exist (documented in api-reference)."""
-        assert hasattr(cache, "test"), "cache.test preset missing"
-        assert callable(cache.test), "cache.test must be callable"
+    @pytest.mark.parametrize("preset", ["minimal", "production", "secure", "dev", "test"])
+    def test_preset_exists(self, preset):
+        """@cache.<preset> must exist (minimal/production/secure in README; all five in api-reference)."""
+        assert hasattr(cache, preset), f"cache.{preset} preset missing"
+        assert callable(getattr(cache, preset)), f"cache.{preset} must be callable"
 
 
 @pytest.mark.critical
@@ -63,14 +44,12 @@ class TestAllDocumentedPresetsWork:
         # Test presets that don't require parameters
         presets = [cache, cache.minimal, cache.production, cache.dev, cache.test]
 
-        for preset in presets:
-
-            @preset
-            def test_func():
-                return "test"
+        def _target():
+            return "test"
 
+        for preset in presets:
             # Verify decorator didn't break the function
-            result = test_func()
+            result = preset(_target)()
             assert result == "test", f"Preset {preset} broke function execution"
 
     def test_secure_preset_requires_master_key(self, monkeypatch):
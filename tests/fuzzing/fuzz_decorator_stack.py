@@ -12,15 +12,20 @@ with atheris.instrument_imports():
     from cachekit.serializers.raw import RawSerializer
 
 
-def TestOneInput(data: bytes) -> None:
-    """Fuzz the complete cache decorator stack."""
-    fdp = atheris.FuzzedDataProvider(data)
+# Decorated once per fuzz session: cache keys derive from the argument, so only the payload varies per input
+_cached_func = None
 
-    try:
-        # Generate test function names to avoid collision
-        func_id = fdp.ConsumeIntInRange(0, 1000000)
 
-        # Create a simple cached function with RawSerializer
+def _get_cached_func():
+    """Build the cached function on first use, inside TestOneInput's guard.
+
+    Construction errors (bad redis_url, serializer init failure) are absorbed
+    like any other expected exception instead of aborting the target at import;
+    a failed build is retried on the next input.
+    """
+    global _cached_func
+    if _cached_func is None:
+
         @redis_cache(
             redis_url="redis://localhost:6379",
             serializer=RawSerializer(),
@@ -30,6 +35,17 @@ def TestOneInput(data: bytes) -> None:
             """Simple cached function that returns input."""
             return value
 
+        _cached_func = cached_func
+    return _cached_func
+
+
+def TestOneInput(data: bytes) -> None:
+    """Fuzz the complete cache decorator stack."""
+    fdp = atheris.FuzzedDataProvider(data)
+
+    try:
+        cached_func = _get_cached_func()
+
         # Test with random payload
         payload = fdp.ConsumeBytes(fdp.ConsumeIntInRange(0, 1024))
 
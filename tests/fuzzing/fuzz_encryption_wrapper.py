@@ -5,33 +5,34 @@ from __future__ import annotations
 
 import os
 import sys
-import uuid
 
 import atheris
 
 with atheris.instrument_imports():
     from cachekit.serializers.encryption_wrapper import EncryptionWrapper
 
+# Master key from environment or a fixed test key for reproducibility; resolved once, not per input
+_MASTER_KEY_HEX = os.environ.get("CACHEKIT_MASTER_KEY")
+_MASTER_KEY = bytes.fromhex(_MASTER_KEY_HEX) if _MASTER_KEY_HEX else b"0" * 32
+
+
+def _uuid_str(b: bytes) -> str:
+    """Format up to 16 bytes in UUID layout without building a uuid.UUID (any stable string is a valid tenant_id)."""
+    h = b.hex()
+    return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+
 
 def TestOneInput(data: bytes) -> None:
     """Fuzz EncryptionWrapper encrypt/decrypt with tenant isolation."""
     fdp = atheris.FuzzedDataProvider(data)
 
-    # Get master key from environment or use a test key
-    master_key_hex = os.environ.get("CACHEKIT_MASTER_KEY")
-    if master_key_hex:
-        master_key = bytes.fromhex(master_key_hex)
-    else:
-        # Use a fixed test key for reproducibility
-        master_key = b"0" * 32
-
     try:
-        serializer = EncryptionWrapper(master_key=master_key)
+        serializer = EncryptionWrapper(master_key=_MASTER_KEY)
 
         # Fuzz payload and tenant ID
         payload = fdp.ConsumeBytes(fdp.ConsumeIntInRange(0, 4096))
         tenant_id_bytes = fdp.ConsumeBytes(16)
-        tenant_id = str(uuid.UUID(bytes=tenant_id_bytes))
+        tenant_id = _uuid_str(tenant_id_bytes)
 
         # Test encryption roundtrip
         encrypted = serializer.serialize(payload, tenant_id=tenant_id)
@@ -42,7 +43,7 @@ def TestOneInput(data: bytes) -> None:
 
         # Test tenant isolation: same data with different tenant_id should produce different ciphertext
         other_tenant_bytes = fdp.ConsumeBytes(16)
-        other_tenant_id = str(uuid.UUID(bytes=other_tenant_bytes))
+        other_tenant_id = _uuid_str(other_tenant_bytes)
         if tenant_id != other_tenant_id:
             encrypted_other = serializer.serialize(payload, tenant_id=other_tenant_id)
             assert encrypted != encrypted_other, "Tenant isolation failed: ciphertexts match"
@@ -26,11 +26,13 @@ Test Coverage:
 
 import logging
 import threading
-import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from unittest.mock import patch
 
 import pytest
+import time_machine
 
 from cachekit import cache
 from cachekit.config import DecoratorConfig
@@ -46,6 +48,19 @@ from cachekit.reliability.circuit_breaker import (
 # Import shared fixtures
 
 
+@pytest.fixture
+def clock():
+    """Frozen wall clock for timeout tests: the breaker reads time.time(), so shift() replaces sleeping."""
+    with time_machine.travel(0, tick=False) as traveller:
+        yield traveller
+
+
+def _force_open(breaker: CircuitBreaker) -> None:
+    """Record exactly enough consecutive failures to trip *breaker* from CLOSED to OPEN."""
+    for _ in range(breaker.config.failure_threshold):
+        breaker.record_failure()
+
+
 class TestCircuitBreakerConfiguration:
     """Test circuit breaker configuration and defaults."""
 
@@ -99,8 +114,7 @@ class TestCircuitBreakerStates:
     def test_failure_transitions_to_open(self):
         """Test that enough failures transition to OPEN state."""
         # Record failures up to threshold
-        for _ in range(self.config.failure_threshold):
-            self.circuit_breaker.record_failure()
+        _force_open(self.circuit_breaker)
 
         assert self.circuit_breaker.state == CircuitState.OPEN
         assert self.circuit_breaker.failure_count == self.config.failure_threshold
@@ -108,31 +122,28 @@ class TestCircuitBreakerStates:
     def test_open_state_prevents_calls(self):
         """Test that OPEN state prevents function calls."""
         # Force circuit to open
-        for _ in range(self.config.failure_threshold):
-            self.circuit_breaker.record_failure()
+        _force_open(self.circuit_breaker)
 
         assert not self.circuit_breaker.should_attempt_call()
 
-    def test_half_open_after_timeout(self):
+    def test_half_open_after_timeout(self, clock):
         """Test transition to HALF_OPEN after timeout."""
         # Force circuit to open
-        for _ in range(self.config.failure_threshold):
-            self.circuit_breaker.record_failure()
+        _force_open(self.circuit_breaker)
 
-        # Wait for timeout
-        time.sleep(self.config.timeout_seconds + 0.1)
+        # Advance past timeout
+        clock.shift(timedelta(seconds=self.config.timeout_seconds + 0.1))
 
         # Should allow calls in HALF_OPEN state
         assert self.circuit_breaker.should_attempt_call()
         assert self.circuit_breaker.state == CircuitState.HALF_OPEN
 
-    def test_half_open_success_returns_to_closed(self):
+    def test_half_open_success_returns_to_closed(self, clock):
         """Test that successes in HALF_OPEN return to CLOSED."""
         # Force to HALF_OPEN
-        for _ in range(self.config.failure_threshold):
-            self.circuit_breaker.record_failure()
+        _force_open(self.circuit_breaker)
 
-        time.sleep(self.config.timeout_seconds + 0.1)
+        clock.shift(timedelta(seconds=self.config.timeout_seconds + 0.1))
         self.circuit_breaker.should_attempt_call()  # Transition to HALF_OPEN
 
         # Record enough successes
@@ -142,13 +153,12 @@ class TestCircuitBreakerStates:
         assert self.circuit_breaker.state == CircuitState.CLOSED
         assert self.circuit_breaker.failure_count == 0
 
-    def test_half_open_failure_returns_to_open(self):
+    def test_half_open_failure_returns_to_open(self, clock):
         """Test that failure in HALF_OPEN returns to OPEN."""
         # Force to HALF_OPEN
-        for _ in range(self.config.failure_threshold):
-            self.circuit_breaker.record_failure()
+        _force_open(self.circuit_breaker)
 
-        time.sleep(self.config.timeout_seconds + 0.1)
+        clock.shift(timedelta(seconds=self.config.timeout_seconds + 0.1))
         self.circuit_breaker.should_attempt_call()  # Transition to HALF_OPEN
 
         # Record failure
@@ -197,30 +207,33 @@ class TestCircuitBreakerRaceConditions:
         valid_states = {CircuitState.CLOSED, CircuitState.OPEN}
         assert all(state in valid_states for state in results)
 
-    def test_open_to_half_open_race_condition(self):
+    def test_open_to_half_open_race_condition(self, clock):
         """Test the critical OPEN → HALF_OPEN race condition fix."""
         # Force circuit to open
-        for _ in range(self.config.failure_threshold):
-            self.circuit_breaker.record_failure()
+        _force_open(self.circuit_breaker)
 
         assert self.circuit_breaker.state == CircuitState.OPEN
 
-        # Wait for timeout
-        time.sleep(self.config.timeout_seconds + 0.1)
+        # Advance past timeout
+        clock.shift(timedelta(seconds=self.config.timeout_seconds + 0.1))
 
         # Multiple threads try to transition to HALF_OPEN simultaneously
-        transition_results = []
+        results = []
+        results_lock = threading.Lock()
+        barrier = threading.Barrier(10)
 
         def attempt_call():
-            """Attempt call and record if it was allowed."""
+            """Release all threads at once, then record whether the call was allowed."""
+            barrier.wait()
             allowed = self.circuit_breaker.should_attempt_call()
-            transition_results.append(allowed)
-            return allowed
+            with results_lock:
+                results.append(allowed)
 
-        # Start multiple threads simultaneously
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(attempt_call) for _ in range(10)]
-            results = [future.result() for future in as_completed(futures)]
+        threads = [threading.Thread(target=attempt_call) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
 
         # Only the configured number of requests should be allowed in HALF_OPEN
         allowed_count = sum(1 for result in results if result)
@@ -243,9 +256,8 @@ class TestCircuitBreakerRaceConditions:
 
         # Start multiple threads
         with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(record_operations) for _ in range(5)]
-            for future in as_completed(futures):
-                future.result()
+            # Draining map() re-raises any worker exception, as future.result() did
+            list(executor.map(lambda _: record_operations(), range(5)))
 
         # Note: success_count/failure_count are state machine counters, not cumulative metrics
 
@@ -330,20 +342,19 @@ class TestCircuitBreakerStateLogging:
         self.config = CircuitBreakerConfig(failure_threshold=2, success_threshold=1, timeout_seconds=0.1)
         self.circuit_breaker = CircuitBreaker(self.config)
 
-    def test_state_transition_logging(self, caplog):
+    def test_state_transition_logging(self, caplog, clock):
         """Test that state transitions are properly logged."""
         caplog.set_level(logging.INFO)
 
         # Transition to OPEN
-        for _ in range(self.config.failure_threshold):
-            self.circuit_breaker.record_failure()
+        _force_open(self.circuit_breaker)
 
         # Check for state transition log
         state_logs = [record for record in caplog.records if "circuit breaker" in record.message.lower()]
         assert len(state_logs) > 0
 
         # Transition to HALF_OPEN
-        time.sleep(self.config.timeout_seconds + 0.1)
+        clock.shift(timedelta(seconds=self.config.timeout_seconds + 0.1))
         self.circuit_breaker.should_attempt_call()
 
         # Transition back to CLOSED
@@ -392,7 +403,7 @@ class TestCircuitBreakerProductionScenarios:
                 assert len(results) == 10
                 # Early calls might fail, later calls should be blocked by circuit breaker
 
-    def test_intermittent_failure_recovery(self):
+    def test_intermittent_failure_recovery(self, clock):
         """Test circuit breaker recovery from intermittent failures."""
         config = CircuitBreakerConfig(failure_threshold=2, success_threshold=1, timeout_seconds=0.1)
         circuit_breaker = CircuitBreaker(config)
@@ -421,8 +432,8 @@ class TestCircuitBreakerProductionScenarios:
                 circuit_breaker.record_failure(e)
                 results.append(("failure", str(e)))
 
-            # Small delay to allow timeout recovery
-            time.sleep(0.05)
+            # Advance the frozen clock so the breaker's 0.1s timeout can expire between calls
+            clock.shift(timedelta(seconds=0.05))
 
         # Should have mix of successes, failures, and blocked calls
         success_count = sum(1 for result, _ in results if result == "success")
@@ -461,16 +472,15 @@ class TestCircuitBreakerProductionScenarios:
 
         # Run with high concurrency
         with ThreadPoolExecutor(max_workers=20) as executor:
-            futures = [executor.submit(concurrent_operation, thread_id) for thread_id in range(20)]
-
-            for future in as_completed(futures):
-                results.extend(future.result())
+            for thread_results in executor.map(concurrent_operation, range(20)):
+                results.extend(thread_results)
 
         # Analyze results
         total_operations = len(results)
-        success_count = results.count("success")
-        failure_count = results.count("failure")
-        blocked_count = results.count("blocked")
+        outcome_counts = Counter(results)
+        success_count = outcome_counts["success"]
+        failure_count = outcome_counts["failure"]
+        blocked_count = outcome_counts["blocked"]
 
         assert total_operations == 1000  # 20 threads × 50 operations
         assert success_count > 0, "Should have successful operations"
@@ -496,8 +506,7 @@ class TestCircuitBreakerMetrics:
 
         # In CLOSED state, successes don't increment success_count
         # (success_count only tracks recovery in HALF_OPEN state)
-        for _ in range(5):
-            self.circuit_breaker.record_success()
+        self.circuit_breaker.record_success()
         assert self.circuit_breaker.success_count == 0  # No increment in CLOSED
 
         # Failures increment failure_count in CLOSED state
@@ -506,16 +515,15 @@ class TestCircuitBreakerMetrics:
         assert self.circuit_breaker.failure_count == 3
         assert self.circuit_breaker.state == CircuitState.CLOSED  # Not enough to open
 
-    def test_metrics_reset_on_state_change(self):
+    def test_metrics_reset_on_state_change(self, clock):
         """Test that metrics reset appropriately on state changes."""
         # Force to OPEN state
-        for _ in range(self.config.failure_threshold):
-            self.circuit_breaker.record_failure()
+        _force_open(self.circuit_breaker)
 
         _failure_count_at_open = self.circuit_breaker.failure_count
 
         # Transition to HALF_OPEN and then CLOSED
-        time.sleep(self.config.timeout_seconds + 0.1)
+        clock.shift(timedelta(seconds=self.config.timeout_seconds + 0.1))
         self.circuit_breaker.should_attempt_call()
 
         for _ in range(self.config.success_threshold):
@@ -5,13 +5,17 @@ Tests the actual decorator behavior with L1-only mode (no Redis required).
 
 from __future__ import annotations
 
-import hashlib
-
 import pytest
+import xxhash
 
 from cachekit import cache
 
 
+def _l1_cache(key_fn):
+    """L1-only @cache decorator (no Redis) with a custom key function, as every test here uses."""
+    return cache(key=key_fn, backend=None, l1_enabled=True)
+
+
 class TestCustomKeyFunctionIntegration:
     """Test custom key function with actual caching behavior."""
 
@@ -19,11 +23,7 @@ class TestCustomKeyFunctionIntegration:
         """Custom key function produces cache hits."""
         call_count = 0
 
-        @cache(
-            key=lambda x, y: f"{x}:{y}",
-            backend=None,  # L1-only mode
-            l1_enabled=True,
-        )
+        @_l1_cache(lambda x, y: f"{x}:{y}")
         def add(x: int, y: int) -> int:
             nonlocal call_count
             call_count += 1
@@ -52,11 +52,7 @@ class TestCustomKeyFunctionIntegration:
         def user_key(user_id, include_deleted=False, **kwargs):
             return f"user:{user_id}"
 
-        @cache(
-            key=user_key,
-            backend=None,
-            l1_enabled=True,
-        )
+        @_l1_cache(user_key)
         def get_user(user_id: int, include_deleted: bool = False) -> dict:
             nonlocal call_count
             call_count += 1
@@ -78,13 +74,12 @@ class TestCustomKeyFunctionIntegration:
         call_count = 0
 
         def array_key(arr):
-            return hashlib.blake2b(arr.tobytes(), digest_size=16).hexdigest()
+            # Hash the buffer in place (no copy when already C-contiguous; slices and
+            # transposes get one). dtype and shape keep equal bytes of different arrays apart.
+            digest = xxhash.xxh3_128_hexdigest(memoryview(np.ascontiguousarray(arr)).cast("B"))
+            return f"{arr.dtype.str}:{'x'.join(map(str, arr.shape))}:{digest}"
 
-        @cache(
-            key=array_key,
-            backend=None,
-            l1_enabled=True,
-        )
+        @_l1_cache(array_key)
         def sum_array(arr) -> float:
             nonlocal call_count
             call_count += 1
@@ -109,15 +104,26 @@ class TestCustomKeyFunctionIntegration:
         assert result3 == 15.0
         assert call_count == 2
 
+        # Non-contiguous view with the same content - cache hit
+        result4 = sum_array(np.array([[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]])[:, 0])
+        assert result4 == 6.0
+        assert call_count == 2
+
+        # Same bytes and dtype, different shape - cache miss
+        result5 = sum_array(arr1.reshape(3, 1))
+        assert result5 == 6.0
+        assert call_count == 3
+
+        # Same bytes (all zero), different dtype - each is its own entry
+        sum_array(np.zeros(3, dtype=np.float64))
+        sum_array(np.zeros(3, dtype=np.int64))
+        assert call_count == 5
+
     def test_custom_key_wrong_return_type_falls_through(self):
         """Key function returning non-string falls through to function execution."""
         call_count = 0
 
-        @cache(
-            key=lambda x: x,  # Returns int, not str - will fail
-            backend=None,
-            l1_enabled=True,
-        )
+        @_l1_cache(lambda x: x)  # Returns int, not str - will fail
         def process(x: int) -> int:
             nonlocal call_count
             call_count += 1
@@ -140,11 +146,7 @@ class TestCustomKeyFunctionIntegration:
         def bad_key(*args):
             raise ValueError("Key generation failed")
 
-        @cache(
-            key=bad_key,
-            backend=None,
-            l1_enabled=True,
-        )
+        @_l1_cache(bad_key)
         def add(x: int, y: int) -> int:
             nonlocal call_count
             call_count += 1
@@ -165,11 +167,7 @@ class TestCustomKeyFunctionAsync:
         """Custom key works with async functions."""
         call_count = 0
 
-        @cache(
-            key=lambda x: f"async:{x}",
-            backend=None,
-            l1_enabled=True,
-        )
+        @_l1_cache(lambda x: f"async:{x}")
         async def async_double(x: int) -> int:
             nonlocal call_count
             call_count += 1
@@ -190,11 +188,7 @@ class TestCustomKeyFunctionAsync:
         """Async: Key function returning non-string falls through to function execution."""
         call_count = 0
 
-        @cache(
-            key=lambda x: 123,  # Returns int, not str - will fail
-            backend=None,
-            l1_enabled=True,
-        )
+        @_l1_cache(lambda x: 123)  # Returns int, not str - will fail
         async def process(x: int) -> int:
             nonlocal call_count
             call_count += 1
@@ -11,6 +11,14 @@ import pytest
 from cachekit.serializers import ArrowSerializer, AutoSerializer, EncryptionWrapper, OrjsonSerializer
 
 
+@pytest.fixture(scope="module")
+def patient_df():
+    """Small DataFrame of sensitive ML features, built once; serialization never mutates it."""
+    return pd.DataFrame(
+        {"patient_id": [101, 102, 103], "diagnosis": ["diabetes", "hypertension", "healthy"], "risk_score": [0.8, 0.6, 0.1]}
+    )
+
+
 class TestEncryptionWrapperComposability:
     """Test EncryptionWrapper can wrap any SerializerProtocol."""
 
@@ -60,14 +68,10 @@ class TestEncryptionWrapperComposability:
         decrypted = orjson_wrapper.deserialize(encrypted, metadata, cache_key=cache_key)
         assert decrypted == api_response
 
-    def test_encryption_wrapper_with_arrow_serializer(self, master_key):
+    def test_encryption_wrapper_with_arrow_serializer(self, master_key, patient_df):
         """EncryptionWrapper with ArrowSerializer (DataFrames) works for zero-knowledge ML caching."""
         arrow_wrapper = EncryptionWrapper(serializer=ArrowSerializer(), master_key=master_key, tenant_id="ml-tenant")
-
-        # Sensitive ML features
-        df = pd.DataFrame(
-            {"patient_id": [101, 102, 103], "diagnosis": ["diabetes", "hypertension", "healthy"], "risk_score": [0.8, 0.6, 0.1]}
-        )
+        df = patient_df
 
         cache_key = "test:encryption:arrow"
         encrypted, metadata = arrow_wrapper.serialize(df, cache_key=cache_key)
@@ -183,26 +187,22 @@ class TestEncryptionWrapperComposability:
             assert meta.compressed is expected_compressed
             assert is_enveloped(data) is expected_compressed, f"{expected_type}: metadata.compressed lies about the bytes"
 
-    def test_encryption_metadata_preserves_format_information(self, master_key):
+    @pytest.mark.parametrize(
+        ("serializer_cls", "expected_format", "data"),
+        [
+            (AutoSerializer, "msgpack", {"test": "data"}),
+            (OrjsonSerializer, "orjson", {"test": "data"}),
+            (ArrowSerializer, "arrow", pd.DataFrame({"a": [1, 2, 3]})),
+        ],
+        ids=["auto", "orjson", "arrow"],
+    )
+    def test_encryption_metadata_preserves_format_information(self, master_key, serializer_cls, expected_format, data):
         """Encryption metadata correctly preserves underlying serialization format."""
-        serializers = [
-            (AutoSerializer(), "msgpack"),
-            (OrjsonSerializer(), "orjson"),
-            (ArrowSerializer(), "arrow"),
-        ]
-
-        for serializer, expected_format in serializers:
-            wrapper = EncryptionWrapper(serializer=serializer, master_key=master_key, tenant_id="test")
-            cache_key = f"test:metadata:{expected_format}"
+        wrapper = EncryptionWrapper(serializer=serializer_cls(), master_key=master_key, tenant_id="test")
+        cache_key = f"test:metadata:{expected_format}"
 
-            # Test with appropriate data for each serializer
-            if expected_format == "arrow":
-                data = pd.DataFrame({"a": [1, 2, 3]})
-            else:
-                data = {"test": "data"}
-
-            encrypted, metadata = wrapper.serialize(data, cache_key=cache_key)
+        encrypted, metadata = wrapper.serialize(data, cache_key=cache_key)
 
-            assert metadata.encrypted is True
-            assert metadata.format.value == expected_format
-            assert metadata.encryption_algorithm == "AES-256-GCM"
+        assert metadata.encrypted is True
+        assert metadata.format.value == expected_format
+        assert metadata.encryption_algorithm == "AES-256-GCM"
@@ -1,7 +1,6 @@
 """Integration tests requiring real Redis instance."""
 
 import asyncio
-import os
 import time
 
 import pytest
@@ -16,21 +15,13 @@ class TestRedisIntegration:
     """Core Redis integration tests."""
 
     @pytest.fixture(autouse=True)
-    def setup_test_env(self, skip_if_no_redis):
-        """Set up test environment with Redis cleanup."""
-
-        # Store original environment
-        original_env = {}
-        test_env = {
-            "REDIS_POOL_HOST": "localhost",
-            "REDIS_POOL_PORT": "6379",
-            "REDIS_POOL_DB": "15",
-        }
+    def setup_test_env(self, skip_if_no_redis, monkeypatch):
+        """Set up test environment with Redis cleanup (monkeypatch restores the original env)."""
 
         # Set test environment
-        for key, value in test_env.items():
-            original_env[key] = os.environ.get(key)
-            os.environ[key] = value
+        monkeypatch.setenv("REDIS_POOL_HOST", "localhost")
+        monkeypatch.setenv("REDIS_POOL_PORT", "6379")
+        monkeypatch.setenv("REDIS_POOL_DB", "15")
 
         # Reset connection pool to pick up test config
         from cachekit.backends.redis.client import reset_global_pool
@@ -47,13 +38,6 @@ class TestRedisIntegration:
         except Exception:
             pass
 
-        # Restore original environment
-        for key, original_value in original_env.items():
-            if original_value is not None:
-                os.environ[key] = original_value
-            elif key in os.environ:
-                del os.environ[key]
-
         # Reset pool again for clean state
         reset_global_pool()
 
@@ -226,21 +210,13 @@ class TestRedisConnectionPoolIntegration:
     """Test connection pool behavior with real Redis."""
 
     @pytest.fixture(autouse=True)
-    def setup_test_env(self, skip_if_no_redis):
-        """Set up test environment with Redis cleanup."""
-
-        # Store original environment
-        original_env = {}
-        test_env = {
-            "REDIS_POOL_HOST": "localhost",
-            "REDIS_POOL_PORT": "6379",
-            "REDIS_POOL_DB": "15",
-        }
+    def setup_test_env(self, skip_if_no_redis, monkeypatch):
+        """Set up test environment with Redis cleanup (monkeypatch restores the original env)."""
 
         # Set test environment
-        for key, value in test_env.items():
-            original_env[key] = os.environ.get(key)
-            os.environ[key] = value
+        monkeypatch.setenv("REDIS_POOL_HOST", "localhost")
+        monkeypatch.setenv("REDIS_POOL_PORT", "6379")
+        monkeypatch.setenv("REDIS_POOL_DB", "15")
 
         # Reset connection pool to pick up test config
         from cachekit.backends.redis.client import reset_global_pool
@@ -257,13 +233,6 @@ class TestRedisConnectionPoolIntegration:
         except Exception:
             pass
 
-        # Restore original environment
-        for key, value in original_env.items():
-            if value is None:
-                os.environ.pop(key, None)
-            else:
-                os.environ[key] = value
-
         # Reset connection pool
         reset_global_pool()
 
@@ -311,21 +280,13 @@ class TestRedisHealthCheck:
     """Test Redis health monitoring with real Redis."""
 
     @pytest.fixture(autouse=True)
-    def setup_test_env(self, skip_if_no_redis):
-        """Set up test environment with Redis cleanup."""
-
-        # Store original environment
-        original_env = {}
-        test_env = {
-            "REDIS_POOL_HOST": "localhost",
-            "REDIS_POOL_PORT": "6379",
-            "REDIS_POOL_DB": "15",
-        }
+    def setup_test_env(self, skip_if_no_redis, monkeypatch):
+        """Set up test environment with Redis cleanup (monkeypatch restores the original env)."""
 
         # Set test environment
-        for key, value in test_env.items():
-            original_env[key] = os.environ.get(key)
-            os.environ[key] = value
+        monkeypatch.setenv("REDIS_POOL_HOST", "localhost")
+        monkeypatch.setenv("REDIS_POOL_PORT", "6379")
+        monkeypatch.setenv("REDIS_POOL_DB", "15")
 
         # Reset connection pool to pick up test config
         from cachekit.backends.redis.client import reset_global_pool
@@ -342,13 +303,6 @@ class TestRedisHealthCheck:
         except Exception:
             pass
 
-        # Restore original environment
-        for key, value in original_env.items():
-            if value is None:
-                os.environ.pop(key, None)
-            else:
-                os.environ[key] = value
-
         # Reset connection pool
         reset_global_pool()
 
@@ -5,8 +5,6 @@ Tests end-to-end serializer integration: ArrowSerializer + EncryptionWrapper + L
 
 from __future__ import annotations
 
-import os
-
 import pandas as pd
 import pytest
 
@@ -20,20 +18,9 @@ class TestSerializerEncryptionComposability:
     """Test encryption composability with serializers (Requirement 3)."""
 
     @pytest.fixture(autouse=True)
-    def setup_encryption(self):
-        """Set up encryption master key for tests."""
-        original_master_key = os.environ.get("CACHEKIT_MASTER_KEY")
-        test_master_key = "a" * 64  # 32 bytes in hex = 64 hex chars
-        os.environ["CACHEKIT_MASTER_KEY"] = test_master_key
-
-        yield
-
-        # Restore original setting
-        if original_master_key is not None:
-            os.environ["CACHEKIT_MASTER_KEY"] = original_master_key
-        else:
-            if "CACHEKIT_MASTER_KEY" in os.environ:
-                del os.environ["CACHEKIT_MASTER_KEY"]
+    def setup_encryption(self, monkeypatch):
+        """Set up encryption master key for tests (monkeypatch restores the original)."""
+        monkeypatch.setenv("CACHEKIT_MASTER_KEY", "a" * 64)  # 32 bytes in hex = 64 hex chars
 
     def test_encryption_wrapper_with_auto_serializer_works(self):
         """EncryptionWrapper with AutoSerializer encrypts data correctly."""
@@ -256,20 +243,15 @@ class TestSerializerWithEncryptionInProduction:
     """
 
     @pytest.fixture(autouse=True)
-    def setup_encryption(self):
+    def setup_encryption(self, monkeypatch):
         """Set up encryption master key and reset the settings singleton each side."""
         from cachekit.config.singleton import reset_settings
 
-        original_master_key = os.environ.get("CACHEKIT_MASTER_KEY")
-        os.environ["CACHEKIT_MASTER_KEY"] = "a" * 64  # 32 bytes hex
+        monkeypatch.setenv("CACHEKIT_MASTER_KEY", "a" * 64)  # 32 bytes hex
         reset_settings()
 
         yield
 
-        if original_master_key is not None:
-            os.environ["CACHEKIT_MASTER_KEY"] = original_master_key
-        else:
-            os.environ.pop("CACHEKIT_MASTER_KEY", None)
         reset_settings()
 
     def test_arrow_dataframe_encrypt_decrypt_roundtrip(self, redis_isolated):
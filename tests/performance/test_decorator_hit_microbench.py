@@ -0,0 +1,28 @@
+"""Decorator cache-hit micro-benchmark (pytest-benchmark, baseline-tracked).
+
+Hot-path latency of a repeat @cache hit against the isolated Redis that the root
+autouse fixture wires in. Correctness of hits and misses is covered by
+tests/integration/test_decorator_with_standard_serializer.py; this file only times it.
+Selected by ``--benchmark-only`` (``make benchmark``); skipped in the normal suite via
+the ``--benchmark-skip`` default in pyproject.toml.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from cachekit import cache
+
+
+@pytest.mark.benchmark
+def test_cache_hit_latency(redis_test_client, benchmark):
+    """Repeat hit on a populated key (100 iterations x 20 rounds)."""
+
+    @cache(ttl=60, namespace="hit_bench")
+    def expensive_computation(user_id: int, multiplier: int = 10) -> dict:
+        return {"user_id": user_id, "result": user_id * multiplier}
+
+    expensive_computation(123, multiplier=5)  # Populate the cache so every measured call is a hit
+
+    result = benchmark.pedantic(expensive_computation, args=(123,), kwargs={"multiplier": 5}, iterations=100, rounds=20)
+    assert result == {"user_id": 123, "result": 615}
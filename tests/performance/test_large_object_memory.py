@@ -24,6 +24,8 @@ import subprocess
 import sys
 import textwrap
 import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import numpy as np
@@ -70,6 +72,28 @@ def _logical(df: pd.DataFrame) -> int:
     return int(df.memory_usage(deep=True, index=True).sum())
 
 
+def _full_gc(max_passes: int = 3) -> None:
+    """Collect until a pass frees nothing (bounded); one pass can leave finalizer-revived garbage."""
+    for _ in range(max_passes):
+        if gc.collect() == 0:
+            break
+
+
+@contextmanager
+def _traced() -> Iterator[Callable[[], int]]:
+    """Trace Python allocations made inside the block; tracing stops even if the block raises.
+
+    Yields a callable returning the traced peak so far — read it before leaving the block.
+    Anything allocated before entry is not counted.
+    """
+    _full_gc()
+    tracemalloc.start()
+    try:
+        yield lambda: tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
 @pytest.mark.slow
 @pytest.mark.performance
 def test_store_path_python_allocations_bounded():
@@ -77,12 +101,10 @@ def test_store_path_python_allocations_bounded():
     logical = _logical(df)
     serializer = ArrowSerializer()
 
-    gc.collect()
-    tracemalloc.start()
-    data, meta = serializer.serialize(df)  # df allocated before start() -> not counted
-    wrapped = SerializationWrapper.wrap(data, meta.to_dict(), "arrow")
-    peak = tracemalloc.get_traced_memory()[1]
-    tracemalloc.stop()
+    with _traced() as traced_peak:
+        data, meta = serializer.serialize(df)  # df allocated before entry -> not counted
+        wrapped = SerializationWrapper.wrap(data, meta.to_dict(), "arrow")
+        peak = traced_peak()
 
     # base64+JSON wrap drove this to ~5.7x; binary frame + zero-copy hashing keeps it ~2x.
     assert peak / logical < 3.0, f"store tracemalloc peak {peak / logical:.2f}x logical (regressed?)"
@@ -101,11 +123,9 @@ def test_load_path_python_allocations_bounded():
     raw, md, _ = SerializationWrapper.unwrap(wrapped)
     meta2 = SerializationMetadata.from_dict(md)
 
-    gc.collect()
-    tracemalloc.start()  # wrapped/raw allocated before start() -> not counted
-    out = serializer.deserialize(raw, meta2)
-    peak = tracemalloc.get_traced_memory()[1]
-    tracemalloc.stop()
+    with _traced() as traced_peak:  # wrapped/raw allocated before entry -> not counted
+        out = serializer.deserialize(raw, meta2)
+        peak = traced_peak()
 
     assert len(out) == len(df)
     pd.testing.assert_frame_equal(out, df)
@@ -291,11 +311,9 @@ def test_file_backend_read_python_allocations_bounded(tmp_path: Path) -> None:
     assert probe is not None, "get_buffer returned None; end-to-end read would fall back to os.read"
     probe.close()
 
-    gc.collect()
-    tracemalloc.start()
-    hit = operation.get_cached_value(key)
-    peak = tracemalloc.get_traced_memory()[1]
-    tracemalloc.stop()
+    with _traced() as traced_peak:
+        hit = operation.get_cached_value(key)
+        peak = traced_peak()
 
     assert hit is not None, "end-to-end File read missed (errors read as miss — check logs)"
     pd.testing.assert_frame_equal(hit[1], df)
@@ -325,11 +343,9 @@ def test_file_backend_bytes_read_python_allocations_bounded(tmp_path: Path) -> N
     key = "perf:file-read:bytes"
     backend.set(key, operation.serialization_handler.serialize_data(payload, cache_key=key))
 
-    gc.collect()
-    tracemalloc.start()
-    hit = operation.get_cached_value(key)
-    peak = tracemalloc.get_traced_memory()[1]
-    tracemalloc.stop()
+    with _traced() as traced_peak:
+        hit = operation.get_cached_value(key)
+        peak = traced_peak()
 
     assert hit is not None, "end-to-end File read missed (errors read as miss — check logs)"
     assert hit[1] == payload
@@ -10,7 +10,7 @@ import pyarrow as pa
 import pytest
 
 from cachekit.serializers.arrow_serializer import ArrowSerializer
-from cachekit.serializers.base import SerializationError, SerializationFormat, SerializationMetadata
+from cachekit.serializers.base import SerializationError, SerializationFormat, SerializationMetadata, UnsupportedDataError
 
 
 class TestArrowSerializerBasics:
@@ -218,6 +218,15 @@ class TestErrorHandling:
         assert "Got: int" in error_msg
         assert "For scalar values or nested dicts, use AutoSerializer" in error_msg
 
+    def test_unsupported_type_raises_unsupported_data_error(self):
+        """Non-tabular values raise UnsupportedDataError, catchable by type and still a TypeError."""
+        serializer = ArrowSerializer()
+
+        with pytest.raises(UnsupportedDataError) as exc_info:
+            serializer.serialize(123)
+
+        assert isinstance(exc_info.value, TypeError)
+
     def test_non_columnar_dict_successfully_serialized(self):
         """Arrow can handle certain dict structures (converts to struct/list types)."""
         serializer = ArrowSerializer()
@@ -17,7 +17,7 @@ from hypothesis import given
 from hypothesis import strategies as st
 
 from cachekit.serializers.auto_serializer import AutoSerializer
-from cachekit.serializers.base import SerializationError
+from cachekit.serializers.base import SerializationError, UnsupportedDataError
 
 
 class TestAutoSerializerUUID:
@@ -238,6 +238,19 @@ class TestAutoSerializerErrorDetection:
         except TypeError as e:
             assert "custom class" in str(e).lower()
 
+    def test_unsupported_type_raises_unsupported_data_error(self):
+        """Unsupported types raise UnsupportedDataError, catchable by type and still a TypeError."""
+        serializer = AutoSerializer()
+
+        class CustomClass:
+            def __init__(self, value):
+                self.value = value
+
+        with pytest.raises(UnsupportedDataError) as exc_info:
+            serializer.serialize(CustomClass(42))
+
+        assert isinstance(exc_info.value, TypeError)
+
     def test_safe_hasattr_prevents_code_execution(self):
         """Test that _safe_hasattr prevents execution of malicious code."""
         from cachekit.serializers.auto_serializer import _safe_hasattr
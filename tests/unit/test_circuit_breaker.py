@@ -123,6 +123,17 @@ class TestCircuitBreaker:
         assert breaker.state == CircuitState.CLOSED
         assert breaker.failure_count == 0
 
+    def test_closed_state_hot_path_is_lock_free(self):
+        """Admission and success recording in CLOSED state never touch the lock."""
+        breaker = CircuitBreaker(CircuitBreakerConfig(), namespace="test")
+        breaker._lock = MagicMock()
+
+        assert breaker.should_attempt_call() is True
+        breaker.record_success()
+
+        breaker._lock.__enter__.assert_not_called()
+        assert breaker._state == CircuitState.CLOSED
+
     def test_failure_counting_closed_state(self):
         """Test failure counting in CLOSED state."""
         config = CircuitBreakerConfig(failure_threshold=3)
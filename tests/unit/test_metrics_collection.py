@@ -3,6 +3,8 @@
 import threading
 from unittest.mock import patch
 
+import pytest
+
 from cachekit.reliability.metrics_collection import (
     AsyncMetricsCollector,
     PrometheusMetricsRegistry,
@@ -125,6 +127,57 @@ class TestAsyncMetricsCollector:
 
         collector.shutdown()
 
+    def test_record_batch(self):
+        """Test that a batch of metrics is enqueued and processed like single records."""
+        collector = AsyncMetricsCollector()
+
+        collector.record_batch(
+            [
+                ("counter", "batch_counter", 2.0, {"id": "a"}),
+                ("counter", "batch_counter", 3.0, {"id": "a"}),
+                ("gauge", "batch_gauge", 0.5, None),
+            ]
+        )
+
+        collector.flush()
+
+        stats = collector.get_stats()
+        assert stats["processed_count"] == 3
+        assert stats["dropped_count"] == 0
+        assert stats["local_metrics"]["batch_counter"]["id=a"] == 5.0
+        assert stats["local_metrics"]["batch_gauge"]["default"] == 0.5
+
+        collector.shutdown()
+
+    def test_record_batch_overflow_drops(self):
+        """Test that batch entries beyond the queue capacity are dropped and counted."""
+        collector = AsyncMetricsCollector(max_queue_size=2)
+
+        collector.record_batch([("counter", "batch_overflow", 1.0, None) for _ in range(20)])
+
+        collector.flush()
+
+        stats = collector.get_stats()
+        assert stats["dropped_count"] > 0
+        assert stats["processed_count"] + stats["dropped_count"] == 20
+
+        collector.shutdown()
+
+    def test_stats_view_is_live_and_read_only(self):
+        """Test that stats_view tracks the collector without being writable."""
+        collector = AsyncMetricsCollector()
+        view = collector.stats_view
+
+        collector.record_counter("view_counter")
+        collector.flush()
+
+        assert view["processed_count"] == 1
+        assert collector.stats_view is view
+        with pytest.raises(TypeError):
+            view["processed_count"] = 0  # type: ignore[index]
+
+        collector.shutdown()
+
     def test_worker_thread_restart(self):
         """Test that worker thread can be restarted if it dies."""
         collector = AsyncMetricsCollector()
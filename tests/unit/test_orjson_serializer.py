@@ -11,7 +11,7 @@ from uuid import UUID
 import pytest
 
 from cachekit.serializers import OrjsonSerializer
-from cachekit.serializers.base import SerializationError, SerializationFormat
+from cachekit.serializers.base import SerializationError, SerializationFormat, UnsupportedDataError
 
 
 class TestOrjsonSerializerBasics:
@@ -255,6 +255,15 @@ class TestOrjsonSerializerErrors:
 
         assert "not JSON-serializable" in str(exc_info.value)
 
+    def test_unsupported_type_raises_unsupported_data_error(self):
+        """Unsupported types raise UnsupportedDataError, catchable by type and still a TypeError."""
+        serializer = OrjsonSerializer()
+
+        with pytest.raises(UnsupportedDataError) as exc_info:
+            serializer.serialize({"raw": b"bytes"})
+
+        assert isinstance(exc_info.value, TypeError)
+
     def test_malformed_data_raises_error(self):
         """Test that malformed data raises SerializationError."""
         serializer = OrjsonSerializer()
@@ -184,7 +184,7 @@ class TestLazyOrjsonSerializerLoading:
         monkeypatch.setattr(serializers_mod, "_get_orjson_serializer", _missing)
         # Bypass the factory cache so get_serializer re-resolves orjson and the
         # ImportError reaches get_serializer_info's except branch.
-        monkeypatch.delitem(serializers_mod._serializer_cache, "orjson:True", raising=False)
+        monkeypatch.delitem(serializers_mod._serializer_cache, ("orjson", True), raising=False)
 
         info = serializers_mod.get_serializer_info()
         assert info["orjson"]["available"] is False
@@ -8,15 +8,20 @@ and multi-language compatibility.
 from __future__ import annotations
 
 import math
+import re
 from datetime import date, datetime, time
 
 import pytest
 
-from cachekit.serializers.base import SerializationError, SerializationFormat, SerializerProtocol
+from cachekit.serializers.base import SerializationError, SerializationFormat, SerializerProtocol, UnsupportedDataError
 from cachekit.serializers.standard_serializer import (
     StandardSerializer,
 )
 
+# Accepted wordings for the unsupported-type TypeErrors, matched in one case-insensitive pass
+_PANDAS_ERROR_RE = re.compile(r"pandas|does not support", re.IGNORECASE)
+_CUSTOM_CLASS_ERROR_RE = re.compile(r"custom class|does not support", re.IGNORECASE)
+
 
 @pytest.mark.unit
 class TestStandardSerializerProtocolCompliance:
@@ -511,8 +516,7 @@ class TestStandardSerializerUnsupportedTypes:
         with pytest.raises(TypeError) as exc_info:
             serializer.serialize(fake_df)
 
-        error_msg = str(exc_info.value)
-        assert "pandas" in error_msg.lower() or "does not support" in error_msg
+        assert _PANDAS_ERROR_RE.search(str(exc_info.value))
 
     def test_pandas_series_error(self) -> None:
         """Test that pandas Series raise TypeError with helpful message."""
@@ -528,8 +532,7 @@ class TestStandardSerializerUnsupportedTypes:
         with pytest.raises(TypeError) as exc_info:
             serializer.serialize(fake_series)
 
-        error_msg = str(exc_info.value)
-        assert "pandas" in error_msg.lower() or "does not support" in error_msg
+        assert _PANDAS_ERROR_RE.search(str(exc_info.value))
 
     def test_pydantic_error(self) -> None:
         """Test that Pydantic models raise TypeError with helpful message.
@@ -592,8 +595,19 @@ class TestStandardSerializerUnsupportedTypes:
         with pytest.raises(TypeError) as exc_info:
             serializer.serialize(custom_obj)
 
-        error_msg = str(exc_info.value)
-        assert "custom class" in error_msg.lower() or "does not support" in error_msg
+        assert _CUSTOM_CLASS_ERROR_RE.search(str(exc_info.value))
+
+    def test_unsupported_type_raises_unsupported_data_error(self) -> None:
+        """Unsupported types raise UnsupportedDataError, catchable by type and still a TypeError."""
+        serializer = StandardSerializer()
+
+        class CustomClass:
+            pass
+
+        with pytest.raises(UnsupportedDataError) as exc_info:
+            serializer.serialize(CustomClass())
+
+        assert isinstance(exc_info.value, TypeError)
 
 
 @pytest.mark.unit